@@ -0,0 +1,84 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+
+"""Preprocess doxygen xml for compatibility with latest Breathe.
+
+This lives outside of conf.py so that files can be cleaned in worker
+processes, which need to import the functions below by name.
+"""
+
+import filecmp
+import re
+import tempfile
+
+from lxml import etree
+
+# Template parameters constrained with CUDF_ENABLE_IF or std::enable_if.
+_enable_if_params = etree.XPath(
+    ".//sectiondef/memberdef/templateparamlist/param"
+    "[type[contains(translate(., 'ENABLE_IF', 'enable_if'), 'enable_if')]]"
+)
+# Template parameters used to set up overloads via ...*=nullptr.
+_nullptr_params = etree.XPath(
+    ".//sectiondef/memberdef/templateparamlist/param"
+    "[type][defval[contains(., 'nullptr')]]"
+)
+# All of these in type declarations cause Breathe to choke.
+# For friend, see https://github.com/breathe-doc/breathe/issues/916
+_strings_to_remove = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            (
+                "__forceinline__",
+                "CUDF_HOST_DEVICE",
+                "decltype(auto)",
+                "friend",
+            ),
+        )
+    )
+)
+
+
+def clean_definitions(root):
+    # Breathe can't handle SFINAE properly:
+    # https://github.com/breathe-doc/breathe/issues/624
+    seen_ids = set()
+    for param in _enable_if_params(root):
+        tparamlist = param.getparent()
+        memberdef = tparamlist.getparent()
+        sectiondef = memberdef.getparent()
+        if sectiondef is None:
+            # The whole overload has already been removed.
+            continue
+        id_ = memberdef.get("id")
+        if id_ not in seen_ids:
+            # If this is the first time we're seeing this function,
+            # just remove the template parameter.
+            seen_ids.add(id_)
+            tparamlist.remove(param)
+        else:
+            # Otherwise, remove the overload altogether and just
+            # rely on documenting one of the SFINAE overloads.
+            sectiondef.remove(memberdef)
+
+    # In addition to enable_if, check for overloads set up by ...*=nullptr.
+    # This is evaluated after the removals above so that parameters that
+    # are already gone are not visited again.
+    for param in _nullptr_params(root):
+        param.getparent().remove(param)
+
+    for node in root.iter():
+        if node.text is not None:
+            node.text = _strings_to_remove.sub("", node.text)
+        if node.tail is not None:
+            node.tail = _strings_to_remove.sub("", node.tail)
+
+
+def clean_xml_file(fn):
+    tree = etree.parse(fn)
+    clean_definitions(tree.getroot())
+    with tempfile.NamedTemporaryFile() as tmp_fn:
+        tree.write(tmp_fn.name, xml_declaration=True, encoding="UTF-8")
+        # Only write files that have actually changed.
+        if not filecmp.cmp(tmp_fn.name, fn):
+            tree.write(fn, xml_declaration=True, encoding="UTF-8")
@@ -17,17 +17,17 @@
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
 import datetime
-import filecmp
 import glob
+import hashlib
 import inspect
+import json
 import os
 import re
 import sys
-import tempfile
 import warnings
-import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 
-from docutils.nodes import Text
+from docutils.nodes import Text, reference
 from packaging.version import Version
 from sphinx.addnodes import pending_xref
 from sphinx.highlighting import lexers
@@ -55,6 +55,9 @@ lexers["pseudo"] = PseudoLexer()
 # -- Custom Extensions ----------------------------------------------------
 sys.path.append(os.path.abspath("./_ext"))
 
+import doxygen_xml  # noqa: E402
+from doxygen_xml import clean_xml_file  # noqa: E402
+
 # -- General configuration ------------------------------------------------
 
 # If your documentation needs a minimal Sphinx version, state it here.
@@ -83,66 +86,49 @@ remove_from_toctrees = ["user_guide/api_docs/api/*"]
 
 
 # Preprocess doxygen xml for compatibility with latest Breathe
-def clean_definitions(root):
-    # Breathe can't handle SFINAE properly:
-    # https://github.com/breathe-doc/breathe/issues/624
-    seen_ids = set()
-    for sectiondef in root.findall(".//sectiondef"):
-        for memberdef in sectiondef.findall("./memberdef"):
-            id_ = memberdef.get("id")
-            for tparamlist in memberdef.findall("./templateparamlist"):
-                for param in tparamlist.findall("./param"):
-                    for type_ in param.findall("./type"):
-                        # CUDF_ENABLE_IF or std::enable_if
-                        if "enable_if" in ET.tostring(type_).decode().lower():
-                            if id_ not in seen_ids:
-                                # If this is the first time we're seeing this function,
-                                # just remove the template parameter.
-                                seen_ids.add(id_)
-                                tparamlist.remove(param)
-                            else:
-                                # Otherwise, remove the overload altogether and just
-                                # rely on documenting one of the SFINAE overloads.
-                                sectiondef.remove(memberdef)
-                            break
-
-                        # In addition to enable_if, check for overloads set up by
-                        # ...*=nullptr.
-                        for type_ in param.findall("./defval"):
-                            if "nullptr" in ET.tostring(type_).decode():
-                                try:
-                                    tparamlist.remove(param)
-                                except ValueError:
-                                    # May have already been removed in above,
-                                    # so skip.
-                                    pass
-                                break
-
-    # All of these in type declarations cause Breathe to choke.
-    # For friend, see https://github.com/breathe-doc/breathe/issues/916
-    strings_to_remove = (
-        "__forceinline__",
-        "CUDF_HOST_DEVICE",
-        "decltype(auto)",
-        "friend",
-    )
-    for node in root.iter():
-        for string in strings_to_remove:
-            if node.text is not None:
-                node.text = node.text.replace(string, "")
-            if node.tail is not None:
-                node.tail = node.tail.replace(string, "")
+def _file_stamp(fn):
+    st = os.stat(fn)
+    return [st.st_mtime_ns, st.st_size]
 
 
 def clean_all_xml_files(path):
+    # Doxygen output only changes when the headers do, so keep a manifest of
+    # the files that were already cleaned and skip them on later builds.
+    # The manifest is stamped with the cleaning code so that changes to the
+    # cleaning rules force every file to be cleaned again.
+    path = os.path.abspath(path)
+    if not os.path.isdir(path):
+        return
+    manifest_fn = os.path.join(path, ".cleaned_manifest.json")
+    with open(doxygen_xml.__file__, "rb") as f:
+        rules = hashlib.sha256(f.read()).hexdigest()
+    try:
+        with open(manifest_fn) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get("rules") != rules:
+        manifest = {}
+    cleaned = manifest.get("files", {})
+
+    files = {}
+    dirty = []
     for fn in glob.glob(os.path.join(path, "*.xml")):
-        tree = ET.parse(fn)
-        clean_definitions(tree.getroot())
-        with tempfile.NamedTemporaryFile() as tmp_fn:
-            tree.write(tmp_fn.name)
-            # Only write files that have actually changed.
-            if not filecmp.cmp(tmp_fn.name, fn):
-                tree.write(fn)
+        if cleaned.get(fn) == _file_stamp(fn):
+            files[fn] = cleaned[fn]
+        else:
+            dirty.append(fn)
+
+    # Files are independent of each other, so clean them in parallel.
+    if dirty:
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(clean_xml_file, dirty, chunksize=8))
+    for fn in dirty:
+        files[fn] = _file_stamp(fn)
+
+    if dirty or len(files) != len(cleaned):
+        with open(manifest_fn, "w") as f:
+            json.dump({"rules": rules, "files": files}, f)
 
 
 # Breathe Configuration
@@ -427,28 +413,81 @@ _names_to_skip_in_cpp = {
     "TypeKind",
 }
 
+# Each set of names is folded into a single alternation so that a reference
+# target is scanned once rather than once per name.
+_skip_in_pylibcudf_pattern = re.compile(
+    "|".join(map(re.escape, sorted(_names_to_skip_in_pylibcudf)))
+)
+_skip_in_cpp_pattern = re.compile(
+    "|".join(map(re.escape, sorted(_names_to_skip_in_cpp)))
+)
+
 _domain_objects = None
 _prefixed_domain_objects = None
+_unprefixed_domain_objects = None
 _intersphinx_cache = {}
 
 _intersphinx_extra_prefixes = ("rmm", "rmm::mr", "mr")
 
+# Matches the base name of a templated type, e.g. "span" in "span<T const>".
+_template_pattern = re.compile(r"([^<]*)<.*>")
+
+
+def _scope_key(node):
+    """Return a hashable form of the C++ scope a reference appears in.
+
+    ``LookupKey`` doesn't define ``__str__``, ``__eq__`` or ``__hash__`` on
+    all Sphinx versions, so build the key from the names and declaration
+    ids of the enclosing symbols instead.
+    """
+    if (parent_key := node.get("cpp:parent_key")) is None:
+        return None
+    return tuple((str(name), id_) for name, _, id_ in parent_key.data)
+
 
 def _cached_intersphinx_lookup(env, node, contnode):
     """Perform an intersphinx lookup and cache the result.
 
-    Have to manually manage the intersphinx cache because lru_cache doesn't
-    handle the env object properly.
+    The cache is keyed on the reference itself rather than on the docutils
+    nodes so that every occurrence of a reference within a build shares one
+    entry. C++ lookups fall back to a name qualified by the enclosing scope,
+    so the scope is part of the key. Only the pieces needed to rebuild the
+    reference node are stored, failed lookups included.
     """
-    key = (node, contnode)
-    if key in _intersphinx_cache:
-        return _intersphinx_cache[key]
-    if (
-        ref := intersphinx.resolve_reference_detect_inventory(
-            env, node, contnode
+    key = (
+        node["refdomain"],
+        node.get("reftype"),
+        node["reftarget"],
+        _scope_key(node),
+    )
+    if key not in _intersphinx_cache:
+        # Resolve as an implicit reference so that the inventory's display
+        # name is recorded even if this particular reference is explicit.
+        probe = node.copy()
+        probe["refexplicit"] = False
+        ref = intersphinx.resolve_reference_detect_inventory(
+            env, probe, contnode
         )
-    ) is not None:
-        _intersphinx_cache[key] = ref
+        if ref is None:
+            _intersphinx_cache[key] = None
+        else:
+            # The inventory has no display name when the title is taken
+            # from the reference itself.
+            dispname = None if ref.children[0] is contnode else ref.astext()
+            _intersphinx_cache[key] = (
+                ref["refuri"],
+                ref.get("reftitle"),
+                dispname,
+            )
+
+    if (cached := _intersphinx_cache[key]) is None:
+        return None
+    refuri, reftitle, dispname = cached
+    ref = reference("", "", internal=False, refuri=refuri, reftitle=reftitle)
+    if dispname is None or node.get("refexplicit"):
+        ref.append(contnode)
+    else:
+        ref.append(contnode.__class__(dispname, dispname))
     return ref
 
 
@@ -456,21 +495,33 @@ def on_missing_reference(app, env, node, contnode):
     # These variables are defined outside the function to speed up the build.
     global \
         _all_namespaces, \
-        _names_to_skip_in_cpp, \
-        _names_to_skip_in_pylibcudf, \
+        _skip_in_cpp_pattern, \
+        _skip_in_pylibcudf_pattern, \
         _intersphinx_extra_prefixes, \
         _domain_objects, \
         _prefixed_domain_objects, \
+        _unprefixed_domain_objects, \
         _intersphinx_cache
 
     # Precompute and cache domains for faster lookups
     if _domain_objects is None:
         _domain_objects = {}
         _prefixed_domain_objects = {}
+        # Maps a name with one of the namespaces stripped to the
+        # (namespace priority, full name) of the object it refers to.
+        unprefixed = {}
         for name, _, _, docname, _, _ in env.domains["cpp"].get_objects():
             _domain_objects[name] = docname
-            for prefix in _all_namespaces:
+            for i, prefix in enumerate(_all_namespaces):
                 _prefixed_domain_objects[f"{prefix}{name}"] = name
+                if name.startswith(prefix):
+                    key = name[len(prefix) :]
+                    unprefixed[key] = min(
+                        unprefixed.get(key, (i, name)), (i, name)
+                    )
+        _unprefixed_domain_objects = {
+            key: name for key, (_, name) in unprefixed.items()
+        }
 
     reftarget = node.get("reftarget")
     if "namespacecudf" in reftarget:
@@ -480,7 +531,7 @@ def on_missing_reference(app, env, node, contnode):
         node["reftarget"] = "cudf::column_device_view"
         return contnode
 
-    if any(toskip in reftarget for toskip in _names_to_skip_in_pylibcudf):
+    if _skip_in_pylibcudf_pattern.search(reftarget):
         return contnode
 
     if (refid := node.get("refid")) is not None and "hpp" in refid:
@@ -490,11 +541,11 @@ def on_missing_reference(app, env, node, contnode):
         return contnode
 
     if node["refdomain"] in ("std", "cpp") and reftarget is not None:
-        if any(toskip in reftarget for toskip in _names_to_skip_in_cpp):
+        if _skip_in_cpp_pattern.search(reftarget):
             return contnode
 
         # Strip template parameters and just use the base type.
-        if match := re.search("(.*)<.*>", reftarget):
+        if match := _template_pattern.match(reftarget):
             reftarget = match.group(1)
 
         # Try to find the target prefixed with e.g. namespaces in case that's
@@ -506,10 +557,7 @@ def on_missing_reference(app, env, node, contnode):
         # (there may be other related issues, I haven't investigated all
         # possible combinations of failures in depth).
         if (name := _prefixed_domain_objects.get(reftarget)) is None:
-            for prefix in _all_namespaces:
-                if f"{prefix}{reftarget}" in _domain_objects:
-                    name = f"{prefix}{reftarget}"
-                    break
+            name = _unprefixed_domain_objects.get(reftarget)
         if name is not None:
             return env.domains["cpp"].resolve_xref(
                 env,
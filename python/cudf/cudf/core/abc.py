@@ -22,6 +22,8 @@ class Serializable:
     latter converts back from that representation into an equivalent object.
     """
 
+    __slots__ = ()
+
     def serialize(self):
         """Generate an equivalent serializable representation of an object.
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import math
 import pickle
 import weakref
@@ -314,6 +315,10 @@ class Buffer(Serializable):
         The size of the buffer (in bytes). If None, use the size of owner.
     """
 
+    # One Buffer exists per column child, so avoid a per-instance __dict__.
+    # `__weakref__` is needed since owners track their slices in a WeakSet.
+    __slots__ = ("_owner", "_offset", "_size", "__weakref__")
+
     def __init__(
         self,
         *,
@@ -480,6 +485,12 @@ class Buffer(Serializable):
         )
 
 
+@functools.lru_cache(maxsize=128)
+def _itemsize(typestr: str) -> int:
+    """Return the item size of an array interface ``typestr``."""
+    return numpy.dtype(typestr).itemsize
+
+
 def get_ptr_and_size(array_interface: Mapping) -> tuple[int, int]:
     """Retrieve the pointer and size from an array interface.
 
@@ -500,11 +511,20 @@ def get_ptr_and_size(array_interface: Mapping) -> tuple[int, int]:
 
     shape = array_interface["shape"] or (1,)
     strides = array_interface["strides"]
-    itemsize = cudf.dtype(array_interface["typestr"]).itemsize
-    if strides is None or cudf._lib.pylibcudf.column.is_c_contiguous(
-        shape, strides, itemsize
-    ):
+    itemsize = _itemsize(array_interface["typestr"])
+    if len(shape) == 1:
+        # Fast path for the common 1-D case
+        nelem = shape[0]
+        contiguous = strides is None or nelem <= 1 or strides[0] == itemsize
+    else:
         nelem = math.prod(shape)
+        contiguous = (
+            strides is None
+            or cudf._lib.pylibcudf.column.is_c_contiguous(
+                shape, strides, itemsize
+            )
+        )
+    if contiguous:
         ptr = array_interface["data"][0] or 0
         return ptr, nelem * itemsize
     raise ValueError("Buffer data must be C-contiguous")
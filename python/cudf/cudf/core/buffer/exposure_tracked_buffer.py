@@ -23,6 +23,8 @@ class ExposureTrackedBuffer(Buffer):
         The size of the slice (in bytes)
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         owner: BufferOwner,
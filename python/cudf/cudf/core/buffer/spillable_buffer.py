@@ -373,6 +373,8 @@ class SpillableBufferOwner(BufferOwner):
 class SpillableBuffer(ExposureTrackedBuffer):
     """A slice of a spillable buffer"""
 
+    __slots__ = ()
+
     _owner: SpillableBufferOwner
 
     def spill(self, target: str = "cpu") -> None:
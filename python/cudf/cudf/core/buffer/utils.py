@@ -6,6 +6,8 @@ import threading
 from contextlib import ContextDecorator
 from typing import Any
 
+import rmm
+
 from cudf.core.buffer.buffer import (
     Buffer,
     BufferOwner,
@@ -129,8 +131,16 @@ def as_buffer(
         owner_class = BufferOwner
         buffer_class = Buffer
 
+    # Common case shortcut: a plain `rmm.DeviceBuffer` (e.g. a libcudf
+    # result) is new device memory that cannot be owned by a BufferOwner.
+    if isinstance(data, rmm.DeviceBuffer):
+        return buffer_class(
+            owner=owner_class.from_device_memory(data, exposed=exposed)
+        )
+
     # Handle host memory,
-    if not hasattr(data, "__cuda_array_interface__"):
+    cai = getattr(data, "__cuda_array_interface__", None)
+    if cai is None:
         if exposed:
             raise ValueError("cannot created exposed host memory")
         return buffer_class(owner=owner_class.from_host_memory(data))
@@ -154,7 +164,7 @@ def as_buffer(
             "An owning spillable buffer must "
             "either be exposed or spill locked."
         )
-    ptr, size = get_ptr_and_size(data.__cuda_array_interface__)
+    ptr, size = get_ptr_and_size(cai)
     base_ptr = owner.get_ptr(mode="read")
     if size > 0 and base_ptr == 0:
         raise ValueError("Cannot create a non-empty slice of a null buffer")
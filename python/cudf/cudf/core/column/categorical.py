@@ -535,10 +535,10 @@ class CategoricalColumn(column.ColumnBase):
 
     def __contains__(self, item: ScalarLike) -> bool:
         try:
-            self._encode(item)
+            code = self._encode(item)
         except ValueError:
             return False
-        return self._encode(item) in self.codes
+        return code in self.codes
 
     def set_base_data(self, value):
         if value is not None:
@@ -854,7 +854,12 @@ class CategoricalColumn(column.ColumnBase):
         )
 
     def _encode(self, value) -> ScalarLike:
-        return self.categories.find_first_value(value)
+        # Categories are unique, so there is at most one match and only a
+        # single element needs to be copied back to the host.
+        indices = self.categories.indices_of(value)
+        if len(indices) == 0:
+            raise ValueError(f"Value {value} not found in column")
+        return indices.element_indexing(0)
 
     def _decode(self, value: int) -> ScalarLike:
         if value == _DEFAULT_CATEGORICAL_VALUE:
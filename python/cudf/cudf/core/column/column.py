@@ -13,7 +13,6 @@ import cupy
 import numpy as np
 import pandas as pd
 import pyarrow as pa
-import pyarrow.compute as pc
 from numba import cuda
 from pandas.core.arrays.arrow.extension_types import ArrowIntervalType
 from typing_extensions import Self
@@ -43,7 +42,6 @@ from cudf.api.types import (
     infer_dtype,
     is_dtype_equal,
     is_scalar,
-    is_string_dtype,
 )
 from cudf.core._compat import PANDAS_GE_210
 from cudf.core._internals.timezones import get_compatible_timezone
@@ -396,7 +394,7 @@ class ColumnBase(Column, Serializable, BinaryOperand, Reducible):
         if not inplace:
             return libcudf.filling.fill(self, begin, end, slr.device_value)
 
-        if is_string_dtype(self.dtype):
+        if isinstance(self, cudf.core.column.StringColumn):
             return self._mimic_inplace(
                 libcudf.filling.fill(self, begin, end, slr.device_value),
                 inplace=True,
@@ -516,10 +514,11 @@ class ColumnBase(Column, Serializable, BinaryOperand, Reducible):
         ------
         ``IndexError`` if out-of-bound
         """
-        idx = np.int32(index)
+        idx = int(index)
+        size = len(self)
         if idx < 0:
-            idx = len(self) + idx
-        if idx > len(self) - 1 or idx < 0:
+            idx += size
+        if idx >= size or idx < 0:
             raise IndexError("single positional indexer is out-of-bounds")
         return libcudf.copying.get_element(self, idx).value
 
@@ -538,11 +537,14 @@ class ColumnBase(Column, Serializable, BinaryOperand, Reducible):
             ]._with_type_metadata(self.dtype)
         else:
             # Need to create a gather map for given slice with stride
-            gather_map = as_column(
-                range(start, stop, stride),
-                dtype=cudf.dtype(np.int32),
+            rng = range(start, stop, stride)
+            gather_map = as_column(rng, dtype=cudf.dtype(np.int32))
+            # The bounds of a range are known on the host, so skip the
+            # device-side minmax check when they are valid.
+            lo, hi = sorted((rng[0], rng[-1]))
+            return self.take(
+                gather_map, check_bounds=not (0 <= lo and hi < len(self))
             )
-            return self.take(gather_map)
 
     def __setitem__(self, key: Any, value: Any):
         """
@@ -755,10 +757,11 @@ class ColumnBase(Column, Serializable, BinaryOperand, Reducible):
     def _find_first_and_last(self, value: ScalarLike) -> tuple[int, int]:
         indices = self.indices_of(value)
         if n := len(indices):
-            return (
-                indices.element_indexing(0),
-                indices.element_indexing(n - 1),
-            )
+            # Copy both ends to the host in one transfer, not one each
+            ends = cupy.asarray(indices.data_array_view(mode="read"))[
+                :: max(n - 1, 1)
+            ].get()
+            return int(ends[0]), int(ends[-1])
         else:
             raise ValueError(f"Value {value} not found in column")
 
@@ -1317,12 +1320,10 @@ class ColumnBase(Column, Serializable, BinaryOperand, Reducible):
         if skipna is None:
             skipna = True
 
-        if self.has_nulls():
-            if skipna:
-                result_col = self.dropna()
-            else:
-                return cudf.utils.dtypes._get_nan_for_dtype(self.dtype)
+        if self.has_nulls() and not skipna:
+            return cudf.utils.dtypes._get_nan_for_dtype(self.dtype)
 
+        # libcudf reductions skip nulls, so they need not be dropped first.
         result_col = self
 
         # TODO: If and when pandas decides to validate that `min_count` >= 0 we
@@ -1387,8 +1388,6 @@ class ColumnBase(Column, Serializable, BinaryOperand, Reducible):
         ]
         dtype: int8
         """
-        from cudf._lib.join import join as cpp_join
-
         if na_sentinel is None or na_sentinel.value is cudf.NA:
             na_sentinel = cudf.Scalar(-1)
 
@@ -1410,7 +1409,7 @@ class ColumnBase(Column, Serializable, BinaryOperand, Reducible):
         except ValueError:
             return _return_sentinel_column()
 
-        left_gather_map, right_gather_map = cpp_join(
+        left_gather_map, right_gather_map = libcudf.join.join(
             [self], [cats], how="left"
         )
         codes = libcudf.copying.gather(
@@ -1807,15 +1806,30 @@ def as_column(
     * range objects
     """
     if isinstance(arbitrary, (range, pd.RangeIndex, cudf.RangeIndex)):
-        column = libcudf.filling.sequence(
-            len(arbitrary),
-            as_device_scalar(arbitrary.start, dtype=cudf.dtype("int64")),
-            as_device_scalar(arbitrary.step, dtype=cudf.dtype("int64")),
-        )
         if cudf.get_option("default_integer_bitwidth") and dtype is None:
             dtype = cudf.dtype(
                 f'i{cudf.get_option("default_integer_bitwidth")//8}'
             )
+        # Generate the sequence directly in the requested integer dtype
+        # when every element fits, saving a separate cast.
+        seq_dtype = cudf.dtype("int64")
+        if (
+            isinstance(dtype, np.dtype)
+            and dtype.kind in "iu"
+            and len(arbitrary) > 0
+        ):
+            last = arbitrary.start + (len(arbitrary) - 1) * arbitrary.step
+            info = np.iinfo(dtype)
+            if all(
+                info.min <= value <= info.max
+                for value in (arbitrary.start, arbitrary.step, last)
+            ):
+                seq_dtype = dtype
+        column = libcudf.filling.sequence(
+            len(arbitrary),
+            as_device_scalar(arbitrary.start, dtype=seq_dtype),
+            as_device_scalar(arbitrary.step, dtype=seq_dtype),
+        )
         if dtype is not None:
             return column.astype(dtype)
         return column
@@ -1854,18 +1868,14 @@ def as_column(
         return col
 
     elif isinstance(arbitrary, (pa.Array, pa.ChunkedArray)):
-        if (nan_as_null is None or nan_as_null) and pa.types.is_floating(
-            arbitrary.type
-        ):
-            arbitrary = pc.if_else(
-                pc.is_nan(arbitrary),
-                pa.nulls(len(arbitrary), type=arbitrary.type),
-                arbitrary,
-            )
-        elif dtype is None and pa.types.is_null(arbitrary.type):
+        if dtype is None and pa.types.is_null(arbitrary.type):
             # default "empty" type
             dtype = "str"
         col = ColumnBase.from_arrow(arbitrary)
+        if nan_as_null is None or nan_as_null:
+            # Mask NaNs on the device instead of building a NaN-free
+            # copy of the Arrow data on the host before the transfer.
+            col = col.nans_to_nulls()
 
         if dtype is not None:
             col = col.astype(dtype)
@@ -2311,7 +2321,10 @@ def concat_columns(objs: "MutableSequence[ColumnBase]") -> ColumnBase:
     # If all columns are `NumericalColumn` with different dtypes,
     # we cast them to a common dtype.
     # Notice, we can always cast pure null columns
-    not_null_col_dtypes = [o.dtype for o in objs if o.null_count != len(o)]
+    all_null = [o.null_count == len(o) for o in objs]
+    not_null_col_dtypes = [
+        o.dtype for o, null in zip(objs, all_null) if not null
+    ]
     if len(not_null_col_dtypes) and all(
         _is_non_decimal_numeric_dtype(dtype) and dtype.kind == "M"
         for dtype in not_null_col_dtypes
@@ -2321,13 +2334,15 @@ def concat_columns(objs: "MutableSequence[ColumnBase]") -> ColumnBase:
         objs = [obj.astype(common_dtype) for obj in objs]
 
     # Find the first non-null column:
-    head = next((obj for obj in objs if obj.null_count != len(obj)), objs[0])
+    head = next(
+        (obj for obj, null in zip(objs, all_null) if not null), objs[0]
+    )
 
-    for i, obj in enumerate(objs):
+    for i, (obj, null) in enumerate(zip(objs, all_null)):
         # Check that all columns are the same type:
         if not is_dtype_equal(obj.dtype, head.dtype):
             # if all null, cast to appropriate dtype
-            if obj.null_count == len(obj):
+            if null:
                 objs[i] = column_empty_like(
                     head, dtype=head.dtype, masked=True, newsize=len(obj)
                 )
@@ -5924,10 +5924,8 @@ class StringColumn(column.ColumnBase):
                 "Can not produce a view of a string column with nulls"
             )
         dtype = cudf.api.types.dtype(dtype)
-        str_byte_offset = self.base_children[0].element_indexing(self.offset)
-        str_end_byte_offset = self.base_children[0].element_indexing(
-            self.offset + self.size
-        )
+        str_byte_offset = self.start_offset
+        str_end_byte_offset = self.end_offset
 
         n_bytes_to_view = str_end_byte_offset - str_byte_offset
 
@@ -42,6 +42,10 @@ from cudf.api.types import (
 )
 from cudf.core import column, df_protocol, indexing_utils, reshape
 from cudf.core._compat import PANDAS_LT_300
+from cudf.core._internals.where import (
+    _check_and_cast_columns_with_other,
+    _make_categorical_like,
+)
 from cudf.core.abc import Serializable
 from cudf.core.column import (
     CategoricalColumn,
@@ -2057,10 +2061,12 @@ class DataFrame(IndexedFrame, Serializable, GetAttrGetItemMixin):
                     "please reindex."
                 )
             rhs = dict(zip(other_pd_index, other.values_host))
-            # For keys in right but not left, perform binops between NaN (not
-            # NULL!) and the right value (result is NaN).
-            left_default = as_column(np.nan, length=len(self))
             equal_columns = other_pd_index.equals(self_pd_columns)
+            if not equal_columns:
+                # For keys in right but not left, perform binops between NaN
+                # (not NULL!) and the right value (result is NaN). Only
+                # materialize the NaN column when such keys can exist.
+                left_default = as_column(np.nan, length=len(self))
             can_use_self_column_name = (
                 equal_columns or other_pd_index.names == self_pd_columns.names
             )
@@ -3057,11 +3063,6 @@ class DataFrame(IndexedFrame, Serializable, GetAttrGetItemMixin):
         elif level is not None:
             raise NotImplementedError("level is not supported.")
 
-        from cudf.core._internals.where import (
-            _check_and_cast_columns_with_other,
-            _make_categorical_like,
-        )
-
         # First process the condition.
         if isinstance(cond, Series):
             cond = self._from_data(
@@ -4791,19 +4792,7 @@ class DataFrame(IndexedFrame, Serializable, GetAttrGetItemMixin):
             )
 
         if na_action == "ignore":
-            devfunc = numba.cuda.jit(device=True)(func)
-
-            # promote to a null-ignoring function
-            # this code is never run in python, it only
-            # exists to provide numba with the correct
-            # bytecode to generate the equivalent PTX
-            # as a null-ignoring version of the function
-            def _func(x):  # pragma: no cover
-                if x is NA:
-                    return NA
-                else:
-                    return devfunc(x)
-
+            _func = _make_null_ignoring_func(func)
         else:
             _func = func
 
@@ -6303,12 +6292,13 @@ class DataFrame(IndexedFrame, Serializable, GetAttrGetItemMixin):
             )
 
         if not skipna and any(col.nullable for col in filtered._columns):
+            # Columns without a null mask are all-valid and cannot change
+            # the row-wise ``all``, so only expand the nullable ones.
             mask = DataFrame(
                 {
-                    name: filtered._data[name]._get_mask_as_column()
-                    if filtered._data[name].nullable
-                    else as_column(True, length=len(filtered._data[name]))
-                    for name in filtered._data.names
+                    name: col._get_mask_as_column()
+                    for name, col in filtered._data.items()
+                    if col.nullable
                 }
             )
             mask = mask.all(axis=1)
@@ -8128,6 +8118,42 @@ for binop in [
     setattr(DataFrame, binop, make_binop_func(binop))
 
 
+def _make_null_ignoring_func(func):
+    # The UDF cache keys on the closure variables of the function being
+    # compiled, so the same wrapper must be returned for the same ``func``
+    # for repeated ``applymap`` calls to reuse the compiled kernels.
+    # Unhashable callables can't be cached and get a new wrapper each time.
+    try:
+        hash(func)
+    except TypeError:
+        return _null_ignoring_func(func)
+    return _cached_null_ignoring_func(func)
+
+
+def _null_ignoring_func(func):
+    devfunc = numba.cuda.jit(device=True)(func)
+
+    # promote to a null-ignoring function
+    # this code is never run in python, it only
+    # exists to provide numba with the correct
+    # bytecode to generate the equivalent PTX
+    # as a null-ignoring version of the function
+    def _func(x):  # pragma: no cover
+        if x is NA:
+            return NA
+        else:
+            return devfunc(x)
+
+    return _func
+
+
+# Bounded like the UDF kernel cache it feeds, so at most this many user
+# functions are kept alive by it.
+_cached_null_ignoring_func = functools.lru_cache(maxsize=32)(
+    _null_ignoring_func
+)
+
+
 def _make_replacement_func(value):
     # This function generates a postprocessing function suitable for use with
     # make_binop_func that fills null columns with the desired fill value.
@@ -416,12 +416,15 @@ class Frame(BinaryOperand, Scannable):
         # Internal function to implement to_cupy and to_numpy, which are nearly
         # identical except for the attribute they access to generate values.
 
+        def get_values(col: ColumnBase) -> cupy.ndarray | numpy.ndarray:
+            if na_value is not None:
+                col = col.fillna(na_value)
+            return get_array(col)
+
         def to_array(
             col: ColumnBase, dtype: np.dtype
         ) -> cupy.ndarray | numpy.ndarray:
-            if na_value is not None:
-                col = col.fillna(na_value)
-            array = get_array(col)
+            array = get_values(col)
             casted_array = module.asarray(array, dtype=dtype)
             if copy and casted_array is array:
                 # Don't double copy after asarray
@@ -459,7 +462,10 @@ class Frame(BinaryOperand, Scannable):
                 # TODO: col.values may fail if there is nullable data or an
                 # unsupported dtype. We may want to catch and provide a more
                 # suitable error.
-                matrix[:, i] = to_array(col, dtype)
+                # Assigning into the (Fortran-ordered) matrix casts and
+                # copies into the contiguous column in one pass, so no
+                # intermediate casted array is needed.
+                matrix[:, i] = get_values(col)
             return matrix
 
     # TODO: As of now, calling cupy.asarray is _much_ faster than calling
@@ -76,6 +76,22 @@ def _is_row_of(chunk, obj):
     )
 
 
+def _concatenated_ranges(starts: np.ndarray, sizes: np.ndarray) -> cp.ndarray:
+    """Concatenate ``range(starts[i], starts[i] + sizes[i])`` for all ``i``.
+
+    The ranges are produced on the device: only the per-group ``starts`` and
+    ``sizes`` are copied over, and each output element finds its group with
+    a search in the (device-side) inclusive scan of ``sizes``.
+    """
+    total = int(sizes.sum())
+    sizes = cp.asarray(sizes, dtype=size_type_dtype)
+    ends = cp.cumsum(sizes, dtype=size_type_dtype)
+    shift = cp.asarray(starts, dtype=size_type_dtype) - (ends - sizes)
+    result = cp.arange(total, dtype=size_type_dtype)
+    result += shift[cp.searchsorted(ends, result, side="right")]
+    return result
+
+
 groupby_doc_template = textwrap.dedent(
     """Group using a mapper or by a Series of columns.
 
@@ -843,12 +859,9 @@ class GroupBy(Serializable, Reducible, Scannable):
             group_offsets = group_offsets[:-1]
         else:
             group_offsets = group_offsets[1:] - size_per_group
-        to_take = np.arange(size_per_group.sum(), dtype=size_type_dtype)
-        fixup = np.empty_like(size_per_group)
-        fixup[0] = 0
-        np.cumsum(size_per_group[:-1], out=fixup[1:])
-        to_take += np.repeat(group_offsets - fixup, size_per_group)
-        to_take = as_column(to_take)
+        to_take = as_column(
+            _concatenated_ranges(group_offsets, size_per_group)
+        )
         result = group_values.iloc[to_take]
         if preserve_order:
             # Can't use _mimic_pandas_order because we need to
@@ -1197,11 +1210,7 @@ class GroupBy(Serializable, Reducible, Scannable):
                 )
                 indices = cp.asarray(indices.data_array_view(mode="read"))
             # Which indices are we going to want?
-            want = np.arange(samples_per_group.sum(), dtype=size_type_dtype)
-            scan = np.empty_like(samples_per_group)
-            scan[0] = 0
-            np.cumsum(samples_per_group[:-1], out=scan[1:])
-            want += np.repeat(group_offsets[:-1] - scan, samples_per_group)
+            want = _concatenated_ranges(group_offsets[:-1], samples_per_group)
             indices = indices[want]
         return group_values.iloc[indices]
 
@@ -5,6 +5,7 @@ import itertools
 import warnings
 from typing import TYPE_CHECKING
 
+import cupy as cp
 import numpy as np
 import pandas as pd
 
@@ -652,7 +653,7 @@ def melt(
     else:
         var_data = (
             cudf.Series(value_vars)
-            .take(np.repeat(np.arange(nval, dtype=dtype), N))
+            .take(cp.repeat(cp.arange(nval, dtype=dtype), N))
             .reset_index(drop=True)
         )
     mdata[var_name] = var_data
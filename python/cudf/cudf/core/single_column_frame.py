@@ -14,6 +14,10 @@ from cudf.api.types import (
     is_integer,
     is_numeric_dtype,
 )
+from cudf.core._internals.where import (
+    _check_and_cast_columns_with_other,
+    _make_categorical_like,
+)
 from cudf.core.column import ColumnBase, as_column
 from cudf.core.column_accessor import ColumnAccessor
 from cudf.core.frame import Frame
@@ -348,11 +352,6 @@ class SingleColumnFrame(Frame, NotIterable):
 
     @_performance_tracking
     def where(self, cond, other=None, inplace=False):
-        from cudf.core._internals.where import (
-            _check_and_cast_columns_with_other,
-            _make_categorical_like,
-        )
-
         if isinstance(other, cudf.DataFrame):
             raise NotImplementedError(
                 "cannot align with a higher dimensional Frame"
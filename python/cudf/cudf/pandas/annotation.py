@@ -30,6 +30,6 @@ except ImportError:
                 return self
 
             def __exit__(self, *exc):
-                return False
+                pass
 
             __call__ = lambda self, fn: fn  # noqa: E731
@@ -4,6 +4,7 @@ import pytest
 
 from cudf import NA, DataFrame
 from cudf.core._compat import PANDAS_CURRENT_SUPPORTED_VERSION, PANDAS_VERSION
+from cudf.core.udf.utils import precompiled
 from cudf.testing import assert_eq
 
 
@@ -62,3 +63,18 @@ def test_applymap_raise_cases():
     with pytest.warns(FutureWarning):
         with pytest.raises(ValueError):
             df.applymap(f, na_action="some_invalid_option")
+
+
+def test_map_na_action_ignore_cache_hit():
+    df = DataFrame({"a": [1, NA, 3], "b": [4, 5, NA]})
+
+    def f(x):
+        return x + 1
+
+    precompiled.clear()
+    df.map(f, na_action="ignore")
+    assert precompiled.currsize == 1
+
+    # make sure we get a hit when reapplying
+    df.map(f, na_action="ignore")
+    assert precompiled.currsize == 1
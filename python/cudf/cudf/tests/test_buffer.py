@@ -19,6 +19,8 @@ arr_len = 10
         (cp.zeros((arr_len, arr_len)), True),
         (cp.zeros((arr_len, arr_len)).reshape(arr_len * arr_len), True),
         (cp.zeros((arr_len, arr_len))[:, 0], False),
+        (cp.zeros(arr_len, dtype="u1")[::2], False),
+        (cp.zeros(arr_len, dtype="u1")[::2][:1], True),
     ],
 )
 def test_buffer_from_cuda_iface_contiguous(data):
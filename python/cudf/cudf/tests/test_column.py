@@ -425,6 +425,24 @@ def test_as_column_buffer(data, expected):
     )
 
 
+@pytest.mark.parametrize(
+    "data",
+    [
+        range(0, 10, 3),
+        range(10, -5, -2),
+        range(0, 1000, 100),
+        range(250, 260),
+        range(0, 5, 1000),
+    ],
+)
+@pytest.mark.parametrize("dtype", ["int8", "uint8", "int32", "uint64"])
+def test_as_column_range_dtype(data, dtype):
+    actual = as_column(data, dtype=np.dtype(dtype))
+    expected = pd.Series(np.array(data).astype(dtype))
+    assert actual.dtype == np.dtype(dtype)
+    assert_eq(cudf.Series._from_column(actual), expected)
+
+
 @pytest.mark.parametrize(
     "data,pyarrow_kwargs,cudf_kwargs",
     [
@@ -4,12 +4,16 @@
 Test method that apply GPU kernel to a frame.
 """
 
+import types
+
+import cachetools
 import numpy as np
 import pytest
 from numba import cuda
 
 from cudf import DataFrame
 from cudf.testing import assert_eq
+from cudf.utils import applyutils
 
 
 @pytest.mark.parametrize("nelem", [1, 2, 64, 128, 129])
@@ -222,3 +226,188 @@ def test_df_apply_chunks_incols_mapping(nelem, chunksize):
     )
 
     assert_eq(outdf[["out1", "out2"]], expected_out)
+
+
+@pytest.mark.parametrize("nelem", [1, 2, 64, 128, 129])
+@pytest.mark.parametrize("chunks", [None, 1, 23])
+def test_df_apply_interleaved_signature(nelem, chunks):
+    # The kernel signature interleaves inputs, outputs and extra arguments
+    # and the renamed inputs are listed in a different order than they
+    # appear in the signature.
+    def kernel(out2, b, extra1, a, out1, extra2):
+        for i, (x, y) in enumerate(zip(a, b)):
+            out1[i] = extra1 * x + y
+            out2[i] = x - extra2 * y
+
+    df = DataFrame()
+    df["in1"] = in1 = np.arange(nelem)
+    df["in2"] = in2 = np.arange(nelem) * 3
+
+    extra1 = 2.5
+    extra2 = 0.5
+
+    expected_out = DataFrame()
+    expected_out["out1"] = extra1 * in1 + in2
+    expected_out["out2"] = in1 - extra2 * in2
+
+    kwargs = dict(
+        incols={"in2": "b", "in1": "a"},
+        outcols=dict(out1=np.float64, out2=np.float64),
+        kwargs=dict(extra2=extra2, extra1=extra1),
+    )
+    if chunks is None:
+        outdf = df.apply_rows(kernel, **kwargs)
+    else:
+        outdf = df.apply_chunks(kernel, chunks=chunks, **kwargs)
+
+    assert_eq(outdf[["out1", "out2"]], expected_out)
+
+
+_scale = 2
+
+
+def _make_scaled_kernel():
+    def kernel(x, out):
+        for i, a in enumerate(x):
+            out[i] = a * _scale
+
+    return kernel
+
+
+def _make_nested_scaled_kernel():
+    def kernel(x, out):
+        return (lambda: _scale)()
+
+    return kernel
+
+
+_scale_module = types.ModuleType("scale_module")
+_scale_module.factor = 2
+
+
+def _make_module_scaled_kernel():
+    def kernel(x, out):
+        for i, a in enumerate(x):
+            out[i] = a * _scale_module.factor
+
+    return kernel
+
+
+def test_df_apply_rows_kernel_cache_globals(monkeypatch):
+    df = DataFrame({"x": np.arange(10)})
+    apply_kwargs = dict(
+        incols=["x"], outcols=dict(out=np.float64), kwargs={}
+    )
+
+    first = df.apply_rows(_make_scaled_kernel(), **apply_kwargs)
+    second = df.apply_rows(_make_scaled_kernel(), **apply_kwargs)
+    np.testing.assert_array_equal(first["out"].to_numpy(), np.arange(10) * 2)
+    assert_eq(first, second)
+
+    # Global values are frozen into the kernel, so a function created after
+    # a global it reads has changed must not reuse the old kernel.
+    monkeypatch.setitem(globals(), "_scale", 3)
+    got = df.apply_rows(_make_scaled_kernel(), **apply_kwargs)
+    np.testing.assert_array_equal(got["out"].to_numpy(), np.arange(10) * 3)
+
+    got = df.apply_rows(_make_module_scaled_kernel(), **apply_kwargs)
+    np.testing.assert_array_equal(got["out"].to_numpy(), np.arange(10) * 2)
+    monkeypatch.setattr(_scale_module, "factor", 3)
+    got = df.apply_rows(_make_module_scaled_kernel(), **apply_kwargs)
+    np.testing.assert_array_equal(got["out"].to_numpy(), np.arange(10) * 3)
+
+
+def test_df_apply_rows_kernel_cache_constant_types():
+    def add_int(x, out):
+        for i, a in enumerate(x):
+            out[i] = a + 0
+
+    def add_float(x, out):
+        for i, a in enumerate(x):
+            out[i] = a + 0.0
+
+    # Adding 0.0 rounds the value through float64, adding 0 doesn't.
+    df = DataFrame({"x": np.array([2**53 + 1], dtype=np.int64)})
+    apply_kwargs = dict(incols=["x"], outcols=dict(out=np.int64), kwargs={})
+    got = df.apply_rows(add_int, **apply_kwargs)
+    assert got["out"].to_numpy()[0] == 2**53 + 1
+    got = df.apply_rows(add_float, **apply_kwargs)
+    assert got["out"].to_numpy()[0] == 2**53
+
+
+def test_make_kernel_cache_key(monkeypatch):
+    def key(func):
+        return applyutils._make_kernel_cache_key(
+            "row", func, ["x", "out"], []
+        )
+
+    # Identical functions share a key unless a global they read, directly
+    # or from nested code, has changed.
+    assert key(_make_scaled_kernel()) == key(_make_scaled_kernel())
+    nested = key(_make_nested_scaled_kernel())
+    assert key(_make_nested_scaled_kernel()) == nested
+    monkeypatch.setitem(globals(), "_scale", 3)
+    assert key(_make_nested_scaled_kernel()) != nested
+
+    # Attributes of module globals can't be captured by value, so these
+    # functions are keyed on the function object itself.
+    kernel = _make_module_scaled_kernel()
+    assert key(kernel) == ("row", kernel)
+
+
+def test_df_apply_rows_reuses_compiler_with_new_kwargs(monkeypatch):
+    def kernel(x, out, extra):
+        for i, a in enumerate(x):
+            out[i] = a * extra
+
+    monkeypatch.setattr(
+        applyutils, "_compiler_cache", cachetools.LRUCache(maxsize=32)
+    )
+    df = DataFrame({"x": np.arange(10)})
+    apply_kwargs = dict(incols=["x"], outcols=dict(out=np.float64))
+
+    got = df.apply_rows(kernel, kwargs=dict(extra=2.0), **apply_kwargs)
+    np.testing.assert_array_equal(got["out"].to_numpy(), np.arange(10) * 2.0)
+
+    # Only the names of the extra arguments are part of the compiler cache
+    # key, their values must be passed through on every call.
+    got = df.apply_rows(kernel, kwargs=dict(extra=5.0), **apply_kwargs)
+    np.testing.assert_array_equal(got["out"].to_numpy(), np.arange(10) * 5.0)
+    assert len(applyutils._compiler_cache) == 1
+
+
+def test_df_apply_rows_cached_compiler_copies_columns():
+    def kernel(x, out):
+        for i, a in enumerate(x):
+            out[i] = a * 2
+
+    df = DataFrame({"x": np.arange(10)})
+    outcols = dict(out=np.float64)
+    df.apply_rows(kernel, incols=["x"], outcols=outcols, kwargs={})
+
+    # Changing the caller's dict must not leak into the cached compiler
+    # that a later call with equal arguments gets.
+    outcols["extra"] = np.float64
+    got = df.apply_rows(
+        kernel, incols=["x"], outcols=dict(out=np.float64), kwargs={}
+    )
+    assert list(got.columns) == ["x", "out"]
+    np.testing.assert_array_equal(got["out"].to_numpy(), np.arange(10) * 2)
+
+
+def test_df_apply_rows_cached_compiler_copies_null_inputs():
+    def kernel(x, out):
+        for i, a in enumerate(x):
+            out[i] = a
+
+    df = DataFrame({"x": [1, 2, 3], "y": [None, 1, None]})
+    incols = ["x"]
+    df.apply_rows(kernel, incols=incols, outcols=dict(out=np.int64), kwargs={})
+
+    # The pessimistic null mask must only be built from the inputs the
+    # compiler was created with, not the caller's later edits.
+    incols.append("y")
+    got = df.apply_rows(
+        kernel, incols=["x"], outcols=dict(out=np.int64), kwargs={}
+    )
+    assert got["out"].null_count == 0
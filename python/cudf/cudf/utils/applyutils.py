@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import functools
+import types
+from pickle import PicklingError, dumps
 from typing import Any
 
+import cachetools
 import cupy as cp
 from numba import cuda
 from numba.core.utils import pysignature
@@ -12,7 +15,7 @@ import cudf
 from cudf import _lib as libcudf
 from cudf.core.buffer import acquire_spill_lock
 from cudf.core.column import column
-from cudf.utils import utils
+from cudf.utils import cudautils, utils
 from cudf.utils._numba import _CUDFNumbaConfig
 from cudf.utils.docutils import docfmt_partial
 
@@ -76,10 +79,16 @@ def apply_rows(
     ----------
     {params}
     """
-    applyrows = ApplyRowsCompiler(
-        func, incols, outcols, kwargs, pessimistic_nulls, cache_key=cache_key
+    applyrows = _get_compiler(
+        ApplyRowsCompiler,
+        func,
+        incols,
+        outcols,
+        kwargs,
+        pessimistic_nulls,
+        cache_key=cache_key,
     )
-    return applyrows.run(df)
+    return applyrows.run(df, kwargs)
 
 
 @doc_applychunks()
@@ -101,10 +110,16 @@ def apply_chunks(
     {params}
     {params_chunks}
     """
-    applychunks = ApplyChunksCompiler(
-        func, incols, outcols, kwargs, pessimistic_nulls, cache_key=None
+    applychunks = _get_compiler(
+        ApplyChunksCompiler,
+        func,
+        incols,
+        outcols,
+        kwargs,
+        pessimistic_nulls,
+        cache_key=None,
     )
-    return applychunks.run(df, chunks=chunks, tpb=tpb)
+    return applychunks.run(df, kwargs, chunks=chunks, tpb=tpb)
 
 
 @acquire_spill_lock()
@@ -128,6 +143,38 @@ def make_aggregate_nullmask(df, columns=None, op="__and__"):
     return out_mask
 
 
+# Compilers only depend on the names of the extra arguments, their values
+# are passed to ``run`` on every call.
+_compiler_cache: cachetools.LRUCache = cachetools.LRUCache(maxsize=32)
+
+
+def _get_compiler(
+    cls, func, incols, outcols, kwargs, pessimistic_nulls, cache_key
+):
+    """Return a (possibly cached) ``cls`` instance for the given arguments."""
+    if isinstance(incols, dict):
+        inputs = tuple(incols.items())
+    else:
+        inputs = tuple((k, k) for k in incols)
+    key = (
+        cls,
+        func,
+        inputs,
+        tuple(outcols.items()),
+        tuple(kwargs),
+        pessimistic_nulls,
+        cache_key,
+    )
+    try:
+        return _compiler_cache[key]
+    except KeyError:
+        compiler = cls(
+            func, incols, outcols, kwargs, pessimistic_nulls, cache_key
+        )
+        _compiler_cache[key] = compiler
+        return compiler
+
+
 class ApplyKernelCompilerBase:
     def __init__(
         self, func, incols, outcols, kwargs, pessimistic_nulls, cache_key
@@ -135,26 +182,38 @@ class ApplyKernelCompilerBase:
         # Get signature of user function
         sig = pysignature(func)
         self.sig = sig
-        self.incols = incols
-        self.outcols = outcols
-        self.kwargs = kwargs
+        # Compilers are cached and shared between calls, so keep copies that
+        # later changes to the caller's objects can't affect.
+        if isinstance(incols, dict):
+            self.incols = dict(incols)
+        else:
+            self.incols = tuple(incols)
+        self.outcols = dict(outcols)
         self.pessimistic_nulls = pessimistic_nulls
         self.cache_key = cache_key
         self.kernel = self.compile(func, sig.parameters.keys(), kwargs.keys())
+        # Resolve the positional order of the kernel arguments once, so that
+        # ``run`` doesn't have to bind them by name on every call.
+        if isinstance(self.incols, dict):
+            self._inputs = tuple(self.incols.items())
+        else:
+            self._inputs = tuple((k, k) for k in self.incols)
+        bound = sig.bind(
+            **dict.fromkeys(
+                [v for _, v in self._inputs]
+                + list(self.outcols)
+                + list(kwargs)
+            )
+        )
+        self._arg_order = tuple(bound.arguments)
 
     @acquire_spill_lock()
-    def run(self, df, **launch_params):
+    def run(self, df, kwargs, **launch_params):
         # Get input columns
-        if isinstance(self.incols, dict):
-            inputs = {
-                v: df[k]._column.data_array_view(mode="read")
-                for (k, v) in self.incols.items()
-            }
-        else:
-            inputs = {
-                k: df[k]._column.data_array_view(mode="read")
-                for k in self.incols
-            }
+        args = {
+            v: df._data[k].data_array_view(mode="read")
+            for k, v in self._inputs
+        }
         # Allocate output columns
         outputs = {}
         for k, dt in self.outcols.items():
@@ -162,15 +221,16 @@ class ApplyKernelCompilerBase:
                 len(df), dt, False
             ).data_array_view(mode="write")
         # Bind argument
-        args = {}
-        for dct in [inputs, outputs, self.kwargs]:
-            args.update(dct)
-        bound = self.sig.bind(**args)
+        args.update(outputs)
+        args.update(kwargs)
+        args = [args[name] for name in self._arg_order]
         # Launch kernel
-        self.launch_kernel(df, bound.args, **launch_params)
+        self.launch_kernel(df, args, **launch_params)
         # Prepare pessimistic nullmask
         if self.pessimistic_nulls:
-            out_mask = make_aggregate_nullmask(df, columns=self.incols)
+            out_mask = make_aggregate_nullmask(
+                df, columns=[k for k, _ in self._inputs]
+            )
         else:
             out_mask = None
         # Prepare output frame
@@ -231,74 +291,65 @@ class ApplyChunksCompiler(ApplyKernelCompilerBase):
             return cuda.as_cuda_array(cp.asarray(chunks)).view("int64")
 
 
-def _make_row_wise_kernel(func, argnames, extras):
+def _kernel_arguments(argnames, extras):
+    """Return the number of kernel arguments and the positions of those that
+    are columns (i.e. not in *extras*).
+
+    Generated kernels only depend on these, so kernels for user functions
+    that differ only in their argument names share one code object.
     """
-    Make a kernel that does a stride loop over the input rows.
+    extras = set(extras)
+    argnames = list(argnames)
+    columns = tuple(i for i, a in enumerate(argnames) if a not in extras)
+    return len(argnames), columns
 
-    Each thread is responsible for a row in each iteration.
-    Several iteration may be needed to handling a large number of rows.
 
-    The resulting kernel can be used with any 1D grid size and 1D block size.
-    """
-    # Build kernel source
-    argnames = list(map(_mangle_user, argnames))
-    extras = list(map(_mangle_user, extras))
-    source = """
-def row_wise_kernel({args}):
-{body}
-"""
+def _compile_kernel_source(name, source):
+    """Compile *source* and return the code object of function *name*."""
+    glbs: dict[str, Any] = {}
+    exec(compile(source, f"<{name}>", "exec"), glbs)
+    return glbs[name].__code__
+
 
-    args = ", ".join(argnames)
+@functools.cache
+def _row_wise_kernel_code(nargs, columns):
+    args = ", ".join(f"arg{i}" for i in range(nargs))
     body = []
 
     body.append("tid = cuda.grid(1)")
     body.append("ntid = cuda.gridsize(1)")
 
-    for a in argnames:
-        if a not in extras:
-            start = "tid"
-            stop = ""
-            stride = "ntid"
-            srcidx = "{a} = {a}[{start}:{stop}:{stride}]"
-            body.append(
-                srcidx.format(a=a, start=start, stop=stop, stride=stride)
-            )
+    for i in columns:
+        body.append(f"arg{i} = arg{i}[tid::ntid]")
 
     body.append(f"inner({args})")
 
     indented = ["{}{}".format(" " * 4, ln) for ln in body]
-    # Finalize source
-    concrete = source.format(args=args, body="\n".join(indented))
-    # Get bytecode
-    glbs = {"inner": cuda.jit(device=True)(func), "cuda": cuda}
-    exec(concrete, glbs)
-    # Compile as CUDA kernel
-    kernel = cuda.jit(glbs["row_wise_kernel"])
-    return kernel
+    source = "def row_wise_kernel({args}):\n{body}\n".format(
+        args=args, body="\n".join(indented)
+    )
+    return _compile_kernel_source("row_wise_kernel", source)
 
 
-def _make_chunk_wise_kernel(func, argnames, extras):
+def _make_row_wise_kernel(func, argnames, extras):
     """
-    Make a kernel that does a stride loop over the input chunks.
-
-    Each block is responsible for a chunk in each iteration.
-    Several iteration may be needed to handling a large number of chunks.
+    Make a kernel that does a stride loop over the input rows.
 
-    The user function *func* will have all threads in the block for its
-    computation.
+    Each thread is responsible for a row in each iteration.
+    Several iteration may be needed to handling a large number of rows.
 
     The resulting kernel can be used with any 1D grid size and 1D block size.
     """
+    code = _row_wise_kernel_code(*_kernel_arguments(argnames, extras))
+    glbs = {"inner": cuda.jit(device=True)(func), "cuda": cuda}
+    # Compile as CUDA kernel
+    kernel = cuda.jit(types.FunctionType(code, glbs))
+    return kernel
 
-    # Build kernel source
-    argnames = list(map(_mangle_user, argnames))
-    extras = list(map(_mangle_user, extras))
-    source = """
-def chunk_wise_kernel(nrows, chunks, {args}):
-{body}
-"""
 
-    args = ", ".join(argnames)
+@functools.cache
+def _chunk_wise_kernel_code(nargs, columns):
+    args = ", ".join(f"arg{i}" for i in range(nargs))
     body = []
 
     body.append("blkid = cuda.blockIdx.x")
@@ -317,59 +368,121 @@ def chunk_wise_kernel(nrows, chunks, {args}):
         + " if curblk + 1 < chunks.size else nrows"
     )
 
-    slicedargs = {}
-    for a in argnames:
-        if a not in extras:
-            slicedargs[a] = f"{a}[start:stop]"
-        else:
-            slicedargs[a] = str(a)
-    body.append(
-        "{}inner({})".format(
-            indent, ", ".join(slicedargs[k] for k in argnames)
-        )
-    )
+    slicedargs = [
+        f"arg{i}[start:stop]" if i in columns else f"arg{i}"
+        for i in range(nargs)
+    ]
+    body.append("{}inner({})".format(indent, ", ".join(slicedargs)))
 
     indented = ["{}{}".format(" " * 4, ln) for ln in body]
-    # Finalize source
-    concrete = source.format(args=args, body="\n".join(indented))
-    # Get bytecode
+    source = "def chunk_wise_kernel(nrows, chunks, {args}):\n{body}\n".format(
+        args=args, body="\n".join(indented)
+    )
+    return _compile_kernel_source("chunk_wise_kernel", source)
+
+
+def _make_chunk_wise_kernel(func, argnames, extras):
+    """
+    Make a kernel that does a stride loop over the input chunks.
+
+    Each block is responsible for a chunk in each iteration.
+    Several iteration may be needed to handling a large number of chunks.
+
+    The user function *func* will have all threads in the block for its
+    computation.
+
+    The resulting kernel can be used with any 1D grid size and 1D block size.
+    """
+    code = _chunk_wise_kernel_code(*_kernel_arguments(argnames, extras))
     glbs = {"inner": cuda.jit(device=True)(func), "cuda": cuda}
-    exec(concrete, glbs)
     # Compile as CUDA kernel
-    kernel = cuda.jit(glbs["chunk_wise_kernel"])
+    kernel = cuda.jit(types.FunctionType(code, glbs))
     return kernel
 
 
 _cache: dict[Any, Any] = dict()
 
 
+def _code_names(code):
+    """Yield the names read by *code* and the code objects nested in it."""
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _code_names(const)
+
+
+def _referenced_globals(func):
+    """Return the names and values of the globals read by *func*.
+
+    Numba freezes global values into the compiled kernel, so they are part
+    of the cache key. Attributes of modules and the bodies of functions
+    are frozen as well but can't be captured by value, so ``None`` is
+    returned if *func* reads any module or function globals.
+    """
+    glbs = func.__globals__
+    referenced = []
+    for name in dict.fromkeys(_code_names(func.__code__)):
+        if name not in glbs:
+            continue
+        value = glbs[name]
+        if isinstance(value, (types.ModuleType, types.FunctionType)):
+            return None
+        referenced.append((name, value))
+    return tuple(referenced)
+
+
+def _make_kernel_cache_key(kind, func, argnames, extras):
+    """Build a cache key for a generated kernel.
+
+    The key is built from the code, closure variables and referenced global
+    values of *func* rather than *func* itself, so that distinct but
+    identical functions (e.g. closures created in a loop) share one
+    compiled kernel.
+    """
+    referenced = _referenced_globals(func)
+    if referenced is None:
+        return kind, func
+    try:
+        # The code object is part of the key because, unlike the plain
+        # ``co_consts`` tuple, it tells constants such as ``0`` and ``0.0``
+        # apart.
+        return kind, cudautils.make_cache_key(
+            func,
+            (
+                func.__code__,
+                tuple(argnames),
+                tuple(extras),
+                dumps(referenced),
+            ),
+        )
+    except (TypeError, AttributeError, PicklingError):
+        # The closure variables can't be serialized, fall back to caching
+        # on the function object.
+        return kind, func
+
+
 @functools.wraps(_make_row_wise_kernel)
-def _load_cache_or_make_row_wise_kernel(cache_key, func, *args, **kwargs):
+def _load_cache_or_make_row_wise_kernel(
+    cache_key, func, argnames, extras, **kwargs
+):
     """Caching version of ``_make_row_wise_kernel``."""
     if cache_key is None:
-        cache_key = func
+        cache_key = _make_kernel_cache_key("row", func, argnames, extras)
     try:
-        out = _cache[cache_key]
-        # print("apply cache loaded", cache_key)
-        return out
+        return _cache[cache_key]
     except KeyError:
-        # print("apply cache NOT loaded", cache_key)
-        kernel = _make_row_wise_kernel(func, *args, **kwargs)
+        kernel = _make_row_wise_kernel(func, argnames, extras, **kwargs)
         _cache[cache_key] = kernel
         return kernel
 
 
 @functools.wraps(_make_chunk_wise_kernel)
-def _load_cache_or_make_chunk_wise_kernel(func, *args, **kwargs):
-    """Caching version of ``_make_row_wise_kernel``."""
+def _load_cache_or_make_chunk_wise_kernel(func, argnames, extras, **kwargs):
+    """Caching version of ``_make_chunk_wise_kernel``."""
+    cache_key = _make_kernel_cache_key("chunk", func, argnames, extras)
     try:
-        return _cache[func]
+        return _cache[cache_key]
     except KeyError:
-        kernel = _make_chunk_wise_kernel(func, *args, **kwargs)
-        _cache[func] = kernel
+        kernel = _make_chunk_wise_kernel(func, argnames, extras, **kwargs)
+        _cache[cache_key] = kernel
         return kernel
-
-
-def _mangle_user(name):
-    """Mangle user variable name"""
-    return f"__user_{name}"
@@ -15,6 +15,9 @@ from cudf.options import get_option
 
 _NVTX_COLORS = ["green", "blue", "purple", "rapids"]
 
+# Stateless, so a single instance can be entered any number of times
+_NULL_CONTEXT = contextlib.nullcontext()
+
 
 def _get_color_for_nvtx(name):
     m = hashlib.sha256()
@@ -26,28 +29,37 @@ def _get_color_for_nvtx(name):
 
 def _performance_tracking(func, domain="cudf_python"):
     """Decorator for applying performance tracking (if enabled)."""
+    # The NVTX range attributes only depend on `func`, so they are built on
+    # first use and shared by all later calls.
+    annotation = None
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        with contextlib.ExitStack() as stack:
-            if get_option("memory_profiling"):
-                # NB: the user still needs to call `rmm.statistics.enable_statistics()`
-                #     to enable memory profiling.
-                stack.enter_context(
-                    rmm.statistics.profiler(
-                        name=rmm.statistics._get_descriptive_name_of_object(
-                            func
-                        )
-                    )
-                )
-            if nvtx.enabled():
-                stack.enter_context(
-                    nvtx.annotate(
-                        message=func.__qualname__,
-                        color=_get_color_for_nvtx(func.__qualname__),
-                        domain=domain,
-                    )
+        nonlocal annotation
+        profile = get_option("memory_profiling")
+        trace = nvtx.enabled()
+        if not (profile or trace):
+            # Nothing is being tracked, skip the context manager overhead.
+            return func(*args, **kwargs)
+        if profile:
+            # NB: the user still needs to call `rmm.statistics.enable_statistics()`
+            #     to enable memory profiling.
+            profiler = rmm.statistics.profiler(
+                name=rmm.statistics._get_descriptive_name_of_object(func)
+            )
+        else:
+            profiler = _NULL_CONTEXT
+        if trace:
+            if annotation is None:
+                annotation = nvtx.annotate(
+                    message=func.__qualname__,
+                    color=_get_color_for_nvtx(func.__qualname__),
+                    domain=domain,
                 )
+            tracer = annotation
+        else:
+            tracer = _NULL_CONTEXT
+        with profiler, tracer:
             return func(*args, **kwargs)
 
     return wrapper